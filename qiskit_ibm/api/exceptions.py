@@ -12,12 +12,20 @@
 
 """Exceptions related to the IBM Quantum API."""
 
+import re
+from typing import Optional
+
 from ..exceptions import IBMError
 
+# Regex used to extract the error code included in the server error messages.
+RE_ERROR_CODE = re.compile(r'Error code: (\d+)')
+
 
 class ApiError(IBMError):
     """Generic IBM Quantum API error."""
-    pass
+
+    error_code: Optional[int] = None
+    """Error code included in the server error message, if any."""
 
 
 class RequestsApiError(ApiError):
@@ -32,6 +40,8 @@ class RequestsApiError(ApiError):
         """
         super().__init__(message)
         self.status_code = status_code
+        match = RE_ERROR_CODE.search(message)
+        self.error_code = int(match.group(1)) if match else None
 
 
 class WebsocketError(ApiError):
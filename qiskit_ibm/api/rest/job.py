@@ -185,7 +185,7 @@ class Job(RestAdapterBase):
         Returns:
             Text response, which is empty if the request was successful.
         """
-        data = json.dumps(qobj_dict, cls=json_encoder.IBMJsonEncoder)
+        data = json_encoder.dumps_qobj(qobj_dict)
         logger.debug('Uploading to object storage.')
         response = self.session.put(url, data=data, bare=True, timeout=600,
                                     headers={'Content-Type': 'application/json'})
@@ -38,6 +38,10 @@ STATUS_FORCELIST = (
     524,  # Cloudflare Timeout
 )
 CUSTOM_HEADER_ENV_VAR = 'QISKIT_IBM_CUSTOM_CLIENT_APP_HEADER'
+# Number of connections kept alive per host. It is sized for the worker threads
+# used by composite jobs, so concurrent requests reuse connections instead of
+# opening (and discarding) a new one each time.
+POOL_MAXSIZE = 32
 logger = logging.getLogger(__name__)
 # Regex used to match the `/devices` endpoint, capturing the device name as group(2).
 # The number of letters for group(2) must be greater than 1, so it does not match
@@ -200,7 +204,7 @@ class RetrySession(Session):
             status_forcelist=STATUS_FORCELIST,
         )
 
-        retry_adapter = HTTPAdapter(max_retries=retry)
+        retry_adapter = HTTPAdapter(max_retries=retry, pool_maxsize=POOL_MAXSIZE)
         self.mount('http://', retry_adapter)
         self.mount('https://', retry_adapter)
 
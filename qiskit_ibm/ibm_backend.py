@@ -15,8 +15,9 @@
 import logging
 import warnings
 import copy
+import time
 
-from typing import Dict, List, Union, Optional, Any
+from typing import Dict, List, Union, Optional, Any, Tuple
 from datetime import datetime as python_datetime
 
 from qiskit.compiler import assemble
@@ -46,13 +47,60 @@ from .exceptions import (IBMBackendError, IBMBackendValueError, IBMBackendJobLim
                          IBMBackendApiError, IBMBackendApiProtocolError)
 from .job import IBMJob, IBMCircuitJob, IBMCompositeJob
 from .utils import validate_job_tags
-from .utils.converters import utc_to_local_all, local_to_utc
+from .utils.converters import local_to_utc
 from .utils.json_decoder import decode_pulse_defaults, decode_backend_properties
 from .utils.backend import convert_reservation_data
 from .utils.utils import api_status_to_job_status
 
 logger = logging.getLogger(__name__)
 
+BACKEND_CACHE_TTL = 300
+"""Number of seconds cached backend properties and pulse defaults are reused."""
+
+_PUBLISHER = Publisher()
+
+# Job statuses corresponding to the api job statuses which are not final.
+_ACTIVE_JOB_STATES = tuple({api_status_to_job_status(status)
+                            for status in ApiJobStatus
+                            if status not in API_JOB_FINAL_STATES})
+
+_PROPERTIES_CACHE: Dict[Tuple[str, str], Tuple[float, BackendProperties]] = {}
+_DEFAULTS_CACHE: Dict[Tuple[str, str], Tuple[float, Optional[PulseDefaults]]] = {}
+
+
+def _datetime_to_utc(value: Optional[python_datetime]) -> Optional[python_datetime]:
+    """Validate an optional local ``datetime`` argument and convert it to UTC.
+
+    Args:
+        value: The ``datetime`` to convert, in local timezone.
+
+    Returns:
+        The ``datetime`` in UTC, or ``None`` if no ``datetime`` was specified.
+
+    Raises:
+        TypeError: If the input is not a ``datetime``.
+    """
+    if not value:
+        return None
+    if not isinstance(value, python_datetime):
+        raise TypeError(f"'{value}' is not of type 'datetime'.")
+    return local_to_utc(value)
+
+
+def _warn_id_deprecated(id_support: bool, delay_support: bool) -> None:
+    """Warn that 'id' instructions are replaced with their equivalent 'delay' instruction.
+
+    Args:
+        id_support: Whether the backend still lists 'id' in its basis gates.
+        delay_support: Whether the backend supports the 'delay' instruction.
+    """
+    status = 'deprecated' if id_support and delay_support else 'removed'
+    warnings.warn(f"Support for the 'id' instruction has been {status} "
+                  "from IBM hardware backends. Any 'id' instructions "
+                  "will be replaced with their equivalent 'delay' instruction. "
+                  "Please use the 'delay' instruction instead.",
+                  DeprecationWarning, stacklevel=5)
+
 
 class IBMBackend(Backend):
     """Backend class interfacing with an IBM Quantum device.
@@ -102,6 +150,17 @@ class IBMBackend(Backend):
     """
 
     id_warning_issued = False
+    """Whether the 'id' instruction warning has been issued, once per process."""
+
+    _DEFAULT_OPTIONS = Options(shots=4000, memory=False,
+                               qubit_lo_freq=None, meas_lo_freq=None,
+                               schedule_los=None,
+                               meas_level=MeasLevel.CLASSIFIED,
+                               meas_return=MeasReturnType.AVERAGE,
+                               memory_slots=None, memory_slot_size=100,
+                               rep_time=None, rep_delay=None,
+                               init_qubits=True, use_measure_esp=None)
+    """Default runtime options, copied by :meth:`_default_options`."""
 
     def __init__(
             self,
@@ -126,21 +185,14 @@ class IBMBackend(Backend):
         self.group = credentials.group
         self.project = credentials.project
 
-        # Attributes used by caching functions.
-        self._properties = None
-        self._defaults = None
+        # Key used by the caches shared by all instances of the same backend.
+        self._cache_key = (credentials.base_url, self.name())
 
     @classmethod
     def _default_options(cls) -> Options:
         """Default runtime options."""
-        return Options(shots=4000, memory=False,
-                       qubit_lo_freq=None, meas_lo_freq=None,
-                       schedule_los=None,
-                       meas_level=MeasLevel.CLASSIFIED,
-                       meas_return=MeasReturnType.AVERAGE,
-                       memory_slots=None, memory_slot_size=100,
-                       rep_time=None, rep_delay=None,
-                       init_qubits=True, use_measure_esp=None)
+        # Return a copy since the options are updated in place by ``set_options()``.
+        return copy.copy(cls._DEFAULT_OPTIONS)
 
     def run(
             self,
@@ -251,11 +303,12 @@ class IBMBackend(Backend):
         # pylint: disable=arguments-differ
         validate_job_tags(job_tags, IBMBackendValueError)
 
+        config = self.configuration()
         sim_method = None
-        if self.configuration().simulator:
-            sim_method = getattr(self.configuration(), 'simulation_method', None)
+        if config.simulator:
+            sim_method = getattr(config, 'simulation_method', None)
 
-        measure_esp_enabled = getattr(self.configuration(), "measure_esp_enabled", False)
+        measure_esp_enabled = getattr(config, "measure_esp_enabled", False)
         # set ``use_measure_esp`` to backend value if not set by user
         if use_measure_esp is None:
             use_measure_esp = measure_esp_enabled
@@ -265,7 +318,7 @@ class IBMBackend(Backend):
                 "'use_measure_esp' is unset or set to 'False'."
             )
 
-        if not self.configuration().simulator:
+        if not config.simulator:
             self._deprecate_id_instruction(circuits)
 
         run_config_dict = self._get_run_config(
@@ -291,8 +344,8 @@ class IBMBackend(Backend):
 
         if isinstance(circuits, list):
             chunk_size = None
-            if hasattr(self.configuration(), 'max_experiments'):
-                backend_max = self.configuration().max_experiments
+            backend_max = getattr(config, 'max_experiments', None)
+            if backend_max is not None:
                 chunk_size = backend_max if max_circuits_per_job is None \
                     else min(backend_max, max_circuits_per_job)
             elif max_circuits_per_job:
@@ -313,11 +366,13 @@ class IBMBackend(Backend):
 
     def _get_run_config(self, **kwargs: Any) -> Dict:
         """Return the consolidated runtime configuration."""
-        run_config_dict = copy.copy(self.options.__dict__)
+        options_dict = self.options.__dict__
+        run_config_dict = options_dict.copy()
+        warn_unknown = not isinstance(self, IBMSimulator)
         for key, val in kwargs.items():
             if val is not None:
                 run_config_dict[key] = val
-                if key not in self.options.__dict__ and not isinstance(self, IBMSimulator):
+                if warn_unknown and key not in options_dict:
                     warnings.warn(f"{key} is not a recognized runtime"  # type: ignore[unreachable]
                                   f" option and may be ignored by the backend.", stacklevel=4)
         return run_config_dict
@@ -365,15 +420,14 @@ class IBMBackend(Backend):
                 job_tags=job_tags,
                 experiment_id=composite_job_id)
         except ApiError as ex:
-            if 'Error code: 3458' in str(ex):
-                raise IBMBackendJobLimitError('Error submitting job: {}'.format(str(ex))) from ex
-            raise IBMBackendApiError('Error submitting job: {}'.format(str(ex))) from ex
+            if ex.error_code == 3458:
+                raise IBMBackendJobLimitError(f'Error submitting job: {ex}') from ex
+            raise IBMBackendApiError(f'Error submitting job: {ex}') from ex
 
         # Error in the job after submission:
         # Transition to the `ERROR` final state.
         if 'error' in submit_info:
-            raise IBMBackendError(
-                'Error submitting job: {}'.format(str(submit_info['error'])))
+            raise IBMBackendError(f"Error submitting job: {submit_info['error']}")
 
         # Submission success.
         try:
@@ -383,8 +437,8 @@ class IBMBackend(Backend):
         except TypeError as err:
             logger.debug("Invalid job data received: %s", submit_info)
             raise IBMBackendApiProtocolError('Unexpected return value received from the server '
-                                             'when submitting job: {}'.format(str(err))) from err
-        Publisher().publish("ibm.job.start", job)
+                                             f'when submitting job: {err}') from err
+        _PUBLISHER.publish("ibm.job.start", job)
         return job
 
     def properties(
@@ -404,7 +458,8 @@ class IBMBackend(Backend):
 
         Args:
             refresh: If ``True``, re-query the server for the backend properties.
-                Otherwise, return a cached version.
+                Otherwise, return a cached version if it was retrieved less than
+                :data:`BACKEND_CACHE_TTL` seconds ago.
             datetime: By specifying `datetime`, this function returns an instance
                 of the :class:`BackendProperties<qiskit.providers.models.BackendProperties>`
                 whose timestamp is closest to, but older than, the specified `datetime`.
@@ -419,24 +474,22 @@ class IBMBackend(Backend):
         # pylint: disable=arguments-differ
         if not isinstance(refresh, bool):
             raise TypeError("The 'refresh' argument needs to be a boolean. "
-                            "{} is of type {}".format(refresh, type(refresh)))
-        if datetime and not isinstance(datetime, python_datetime):
-            raise TypeError("'{}' is not of type 'datetime'.")
-
-        if datetime:
-            datetime = local_to_utc(datetime)
-
-        if datetime or refresh or self._properties is None:
-            api_properties = self._api_client.backend_properties(self.name(), datetime=datetime)
-            if not api_properties:
-                return None
-            decode_backend_properties(api_properties)
-            api_properties = utc_to_local_all(api_properties)
-            backend_properties = BackendProperties.from_dict(api_properties)
-            if datetime:    # Don't cache result.
-                return backend_properties
-            self._properties = backend_properties
-        return self._properties
+                            f"{refresh} is of type {type(refresh)}")
+        datetime = _datetime_to_utc(datetime)
+
+        if not (datetime or refresh):
+            cached = _PROPERTIES_CACHE.get(self._cache_key)
+            if cached and time.monotonic() - cached[0] < BACKEND_CACHE_TTL:
+                return cached[1]
+
+        api_properties = self._api_client.backend_properties(self.name(), datetime=datetime)
+        if not api_properties:
+            return None
+        decode_backend_properties(api_properties)
+        backend_properties = BackendProperties.from_dict(api_properties)
+        if not datetime:    # Don't cache result for a specific datetime.
+            _PROPERTIES_CACHE[self._cache_key] = (time.monotonic(), backend_properties)
+        return backend_properties
 
     def status(self) -> BackendStatus:
         """Return the backend status.
@@ -459,7 +512,7 @@ class IBMBackend(Backend):
         except TypeError as ex:
             raise IBMBackendApiProtocolError(
                 'Unexpected return value received from the server when '
-                'getting backend status: {}'.format(str(ex))) from ex
+                f'getting backend status: {ex}') from ex
 
     def defaults(self, refresh: bool = False) -> Optional[PulseDefaults]:
         """Return the pulse defaults for the backend.
@@ -470,20 +523,33 @@ class IBMBackend(Backend):
 
         Args:
             refresh: If ``True``, re-query the server for the backend pulse defaults.
-                Otherwise, return a cached version.
+                Otherwise, return a cached version if it was retrieved less than
+                :data:`BACKEND_CACHE_TTL` seconds ago.
 
         Returns:
             The backend pulse defaults or ``None`` if the backend does not support pulse.
         """
-        if refresh or self._defaults is None:
-            api_defaults = self._api_client.backend_pulse_defaults(self.name())
-            if api_defaults:
-                decode_pulse_defaults(api_defaults)
-                self._defaults = PulseDefaults.from_dict(api_defaults)
-            else:
-                self._defaults = None
-
-        return self._defaults
+        if not refresh:
+            cached = _DEFAULTS_CACHE.get(self._cache_key)
+            if cached and time.monotonic() - cached[0] < BACKEND_CACHE_TTL:
+                return cached[1]
+
+        api_defaults = self._api_client.backend_pulse_defaults(self.name())
+        defaults = None
+        if api_defaults:
+            decode_pulse_defaults(api_defaults)
+            defaults = PulseDefaults.from_dict(api_defaults)
+        _DEFAULTS_CACHE[self._cache_key] = (time.monotonic(), defaults)
+        return defaults
+
+    def invalidate_caches(self) -> None:
+        """Discard the cached backend properties and pulse defaults.
+
+        The next call to :meth:`properties` or :meth:`defaults` will re-query
+        the server. The caches are shared by all instances of this backend.
+        """
+        _PROPERTIES_CACHE.pop(self._cache_key, None)
+        _DEFAULTS_CACHE.pop(self._cache_key, None)
 
     def job_limit(self) -> BackendJobLimit:
         """Return the job limit for the backend.
@@ -527,7 +593,7 @@ class IBMBackend(Backend):
         except TypeError as ex:
             raise IBMBackendApiProtocolError(
                 'Unexpected return value received from the server when '
-                'querying job limit data for the backend: {}.'.format(ex)) from ex
+                f'querying job limit data for the backend: {ex}.') from ex
 
     def remaining_jobs_count(self) -> Optional[int]:
         """Return the number of remaining jobs that could be submitted to the backend.
@@ -570,12 +636,8 @@ class IBMBackend(Backend):
         Returns:
             A list of the unfinished jobs for this backend on this provider.
         """
-        # Get the list of api job statuses which are not a final api job status.
-        active_job_states = list({api_status_to_job_status(status)
-                                  for status in ApiJobStatus
-                                  if status not in API_JOB_FINAL_STATES})
         provider = self.provider()
-        return provider.backend.jobs(status=active_job_states, limit=limit)
+        return provider.backend.jobs(status=list(_ACTIVE_JOB_STATES), limit=limit)
 
     def reservations(
             self,
@@ -596,9 +658,12 @@ class IBMBackend(Backend):
 
         Returns:
             A list of reservations that match the criteria.
+
+        Raises:
+            TypeError: If an input argument is not of the correct type.
         """
-        start_datetime = local_to_utc(start_datetime) if start_datetime else None
-        end_datetime = local_to_utc(end_datetime) if end_datetime else None
+        start_datetime = _datetime_to_utc(start_datetime)
+        end_datetime = _datetime_to_utc(end_datetime)
         raw_response = self._api_client.backend_reservations(
             self.name(), start_datetime, end_datetime)
         return convert_reservation_data(raw_response, self.name())
@@ -645,54 +710,53 @@ class IBMBackend(Backend):
             None
         """
 
-        id_support = 'id' in getattr(self.configuration(), 'basis_gates', [])
-        delay_support = 'delay' in getattr(self.configuration(), 'supported_instructions', [])
+        config = self.configuration()
+        id_support = 'id' in getattr(config, 'basis_gates', [])
+        delay_support = 'delay' in getattr(config, 'supported_instructions', [])
 
         if not delay_support:
             return
 
-        if not isinstance(circuits, List):
+        if not isinstance(circuits, list):
             circuits = [circuits]
-
-        circuit_has_id = any(instr.name == 'id'
-                             for circuit in circuits
-                             if isinstance(circuit, QuantumCircuit)
-                             for instr, qargs, cargs in circuit.data)
-
-        if not circuit_has_id:
+        # Pulse schedules have no 'id' instructions to replace.
+        quantum_circuits = [circ for circ in circuits if isinstance(circ, QuantumCircuit)]
+        if not quantum_circuits:
             return
 
-        if not self.id_warning_issued:
-            if id_support and delay_support:
-                warnings.warn("Support for the 'id' instruction has been deprecated "
-                              "from IBM hardware backends. Any 'id' instructions "
-                              "will be replaced with their equivalent 'delay' instruction. "
-                              "Please use the 'delay' instruction instead.", DeprecationWarning,
-                              stacklevel=4)
-            else:
-                warnings.warn("Support for the 'id' instruction has been removed "
-                              "from IBM hardware backends. Any 'id' instructions "
-                              "will be replaced with their equivalent 'delay' instruction. "
-                              "Please use the 'delay' instruction instead.", DeprecationWarning,
-                              stacklevel=4)
-
-            self.id_warning_issued = True
-
-        dt_in_s = self.configuration().dt
-
-        for circuit in circuits:
-            if isinstance(circuit, Schedule):
-                continue
+        # Looked up when the first 'id' instruction is found.
+        found_id = False
+        dt_in_s = gate_length = None
+        # Equivalent 'delay' duration, in dt, of an 'id' instruction on each qubit.
+        sx_duration_in_dt_by_qubit: Dict[int, int] = {}
 
-            for idx, (instr, qargs, cargs) in enumerate(circuit.data):
-                if instr.name == 'id':
+        for circuit in quantum_circuits:
+            data = circuit.data
+            id_indexes = [idx for idx, inst in enumerate(data) if inst[0].name == 'id']
+            if not id_indexes:
+                continue
 
-                    sx_duration = self.properties().gate_length('sx', qargs[0].index)
+            if not found_id:
+                found_id = True
+                if not IBMBackend.id_warning_issued:
+                    _warn_id_deprecated(id_support, delay_support)
+                    IBMBackend.id_warning_issued = True
+
+                dt_in_s = config.dt
+                gate_length = self.properties().gate_length
+
+            for idx in id_indexes:
+                _, qargs, cargs = data[idx]
+                qubit = qargs[0].index
+                sx_duration_in_dt = sx_duration_in_dt_by_qubit.get(qubit)
+                if sx_duration_in_dt is None:
+                    sx_duration = gate_length('sx', qubit)
                     sx_duration_in_dt = duration_in_dt(sx_duration, dt_in_s)
+                    sx_duration_in_dt_by_qubit[qubit] = sx_duration_in_dt
 
-                    delay_instr = Delay(sx_duration_in_dt)
+                delay_instr = Delay(sx_duration_in_dt)
 
-                    circuit.data[idx] = (delay_instr, qargs, cargs)
+                data[idx] = (delay_instr, qargs, cargs)
 
 
 class IBMSimulator(IBMBackend):
@@ -751,13 +815,14 @@ class IBMSimulator(IBMBackend):
                           "You can now pass backend options as key-value pairs to the "
                           "run() method. For example: backend.run(circs, shots=2048).",
                           DeprecationWarning, stacklevel=2)
-        backend_options = backend_options or {}
-        run_config = copy.deepcopy(backend_options)
+        # Only top level keys are overridden below, so a shallow copy is enough
+        # to leave the caller's dictionary untouched.
+        run_config = dict(backend_options or {})
         if noise_model:
-            try:
-                noise_model = noise_model.to_dict()
-            except AttributeError:
-                pass
+            # Noise models are often given directly as dictionaries.
+            to_dict = getattr(noise_model, 'to_dict', None)
+            if to_dict is not None:
+                noise_model = to_dict()
         run_config.update(kwargs)
         return super().run(circuits, job_name=job_name,
                            job_tags=job_tags,
@@ -837,7 +902,7 @@ class IBMRetiredBackend(IBMBackend):
     ) -> None:
         """Run a Circuit."""
         # pylint: disable=arguments-differ
-        raise IBMBackendError('This backend ({}) is no longer available.'.format(self.name()))
+        raise IBMBackendError(f'This backend ({self.name()}) is no longer available.')
 
     @classmethod
     def from_name(
@@ -526,7 +526,7 @@ class IBMBackendService:
         try:
             job_info = self._provider._api_client.job_get(job_id)
         except ApiError as ex:
-            if 'Error code: 3250.' in str(ex):
+            if ex.error_code == 3250:
                 raise IBMJobNotFoundError(f"Job {job_id} not found.")
             raise IBMBackendApiError('Failed to get job {}: {}'.format(job_id, str(ex))) from ex
         job = self._restore_circuit_job(job_info, raise_error=True)
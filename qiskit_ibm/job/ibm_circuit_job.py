@@ -35,7 +35,7 @@ from ..api.exceptions import ApiError, UserTimeoutExceededError
 from ..utils.utils import RefreshQueue, validate_job_tags, api_status_to_job_status
 from ..utils.qobj_utils import dict_to_qobj
 from ..utils.json_decoder import decode_backend_properties, decode_result
-from ..utils.converters import utc_to_local, utc_to_local_all
+from ..utils.converters import utc_to_local
 from .exceptions import (IBMJobApiError, IBMJobFailureError,
                          IBMJobTimeoutError, IBMJobInvalidStateError)
 from .queueinfo import QueueInfo
@@ -185,7 +185,6 @@ class IBMCircuitJob(IBMJob):
             return None
 
         decode_backend_properties(properties)
-        properties = utc_to_local_all(properties)
         return BackendProperties.from_dict(properties)
 
     def result(
@@ -20,6 +20,7 @@ from datetime import datetime
 from concurrent import futures
 from collections import defaultdict
 import threading
+import itertools
 import copy
 from functools import wraps
 import time
@@ -108,6 +109,9 @@ class IBMCompositeJob(IBMJob):
     _executor = futures.ThreadPoolExecutor()
     """Threads used for asynchronous processing."""
 
+    _max_concurrent_submits = 8
+    """Maximum number of sub-jobs being submitted at the same time."""
+
     def __init__(
             self,
             backend: 'ibm_backend.IBMBackend',
@@ -164,6 +168,8 @@ class IBMCompositeJob(IBMJob):
 
         # Properties used for wait_for_final_state callback.
         self._callback_lock = threading.Lock()
+        self._submit_lock = threading.Lock()
+        self._job_limit_lock = threading.Lock()
         self._user_callback: Optional[Callable] = None
         self._user_wait_value: Optional[float] = None
         # A tuple of status and queue position.
@@ -242,7 +248,8 @@ class IBMCompositeJob(IBMJob):
                 SubJob(start_index=exp_index, end_index=exp_index+len(circs)-1,
                        job_index=idx, total=len(circuit_lists), qobj=qobj))
             exp_index += len(circs)
-        self._sub_jobs[0].event.set()  # Tell the first job it can now be submitted.
+        # Tell the first jobs they can now be submitted.
+        self._wake_pending_submits(self._max_concurrent_submits)
 
         for sub_job in self._sub_jobs:
             sub_job.future = self._executor.submit(self._async_submit, sub_job=sub_job)
@@ -268,47 +275,67 @@ class IBMCompositeJob(IBMJob):
         sub_job.event.wait()
 
         try:
-            while job is None:
+            try:
                 if self._user_cancelled:
                     return  # Abandon submit if user cancelled.
-                try:
-                    job = auto_retry(self.backend()._submit_job,
-                                     qobj=sub_job.qobj, job_name=self._name,
-                                     job_tags=tags, composite_job_id=self.job_id())
-                except IBMBackendJobLimitError:
-                    oldest_running = self._provider.backend.jobs(
-                        limit=1, descending=False, ignore_composite_jobs=True,
-                        status=list(set(JobStatus)-set(JOB_FINAL_STATES)))
-                    if oldest_running:
-                        oldest_running = oldest_running[0]
-                        logger.warning("Job limit reached, waiting for job %s to finish "
-                                       "before submitting the next one.",
-                                       oldest_running.job_id())
+                job = self._submit_sub_job(sub_job, tags)
+            except IBMBackendJobLimitError:
+                # Only one sub-job at a time waits for the job limit to clear,
+                # rather than every pending submit retrying on its own.
+                with self._job_limit_lock:
+                    while job is None:
+                        if self._user_cancelled:
+                            return  # Abandon submit if user cancelled.
                         try:
-                            # Set a timeout in case the job is stuck.
-                            oldest_running.wait_for_final_state(timeout=300)
-                        except Exception as err:  # pylint: disable=broad-except
-                            # Don't kill the submit if unable to wait for old job.
-                            logger.debug("An error occurred while waiting for "
-                                         "job %s to finish: %s", oldest_running.job_id(), err)
-                except Exception as err:  # pylint: disable=broad-except
-                    sub_job.submit_error = err
-                    logger.debug("An error occurred submitting sub-job %s: %s",
-                                 sub_job.job_index, traceback.format_exc())
-                    raise
-
+                            job = self._submit_sub_job(sub_job, tags)
+                        except IBMBackendJobLimitError:
+                            self._wait_for_oldest_job()
+        except Exception as err:  # pylint: disable=broad-except
+            sub_job.submit_error = err
+            logger.debug("An error occurred submitting sub-job %s: %s",
+                         sub_job.job_index, traceback.format_exc())
+            raise
+        else:
             if self._user_cancelled:
                 job.cancel()
             sub_job.job = job
             logger.debug("Job %s submitted for circuits %s-%s.",
                          job.job_id(), sub_job.start_index, sub_job.end_index)
         finally:
+            # Wake up the next submit.
+            self._wake_pending_submits()
+
+    def _submit_sub_job(self, sub_job: SubJob, tags: List[str]) -> IBMCircuitJob:
+        """Submit the Qobj of a sub-job to the backend.
+
+        Args:
+            sub_job: A sub job.
+            tags: Tags to assign to the job.
+
+        Returns:
+            The submitted job.
+        """
+        return auto_retry(self.backend()._submit_job,
+                          qobj=sub_job.qobj, job_name=self._name,
+                          job_tags=tags, composite_job_id=self.job_id())
+
+    def _wait_for_oldest_job(self) -> None:
+        """Wait for the oldest unfinished job on the backend to finish."""
+        oldest_running = self._provider.backend.jobs(
+            limit=1, descending=False, ignore_composite_jobs=True,
+            status=list(set(JobStatus)-set(JOB_FINAL_STATES)))
+        if oldest_running:
+            oldest_running = oldest_running[0]
+            logger.warning("Job limit reached, waiting for job %s to finish "
+                           "before submitting the next one.",
+                           oldest_running.job_id())
             try:
-                # Wake up the next submit.
-                next(sub_job.event for sub_job in self._sub_jobs
-                     if not sub_job.event.is_set()).set()
-            except StopIteration:
-                pass
+                # Set a timeout in case the job is stuck.
+                oldest_running.wait_for_final_state(timeout=300)
+            except Exception as err:  # pylint: disable=broad-except
+                # Don't kill the submit if unable to wait for old job.
+                logger.debug("An error occurred while waiting for "
+                             "job %s to finish: %s", oldest_running.job_id(), err)
 
     @_requires_submit
     def properties(self) -> Optional[Union[List[BackendProperties], BackendProperties]]:
@@ -933,12 +960,21 @@ class IBMCompositeJob(IBMJob):
                      [JobStatus.ERROR, JobStatus.CANCELLED]):
                 sub_job.reset()
                 sub_job.future = self._executor.submit(self._async_submit, sub_job=sub_job)
-        try:
-            next(sub_job.event for sub_job in self._sub_jobs if not sub_job.event.is_set()).set()
-        except StopIteration:
-            pass
+        self._wake_pending_submits(self._max_concurrent_submits)
         self._status = JobStatus.INITIALIZING
 
+    def _wake_pending_submits(self, count: int = 1) -> None:
+        """Allow sub-jobs waiting to be submitted to proceed.
+
+        Args:
+            count: Maximum number of sub-jobs to wake up.
+        """
+        # Sub-jobs finishing at the same time must not wake the same pending sub-job.
+        with self._submit_lock:
+            pending = (sub_job.event for sub_job in self._sub_jobs if not sub_job.event.is_set())
+            for event in itertools.islice(pending, count):
+                event.set()
+
     def block_for_submit(self) -> None:
         """Block until all sub-jobs are submitted."""
         futures.wait([sub_job.future for sub_job in self._sub_jobs if sub_job.future is not None])
@@ -1159,9 +1195,16 @@ class IBMCompositeJob(IBMJob):
                 job information from the server.
         """
         if not self._qobj:
-            self._qobj = copy.deepcopy(self._sub_jobs[0].qobj)
+            # Only copy the top level of the first Qobj. The experiments of all
+            # sub-jobs are shared, so there is no need to deep copy them.
+            first_qobj = self._sub_jobs[0].qobj
+            qobj = copy.copy(first_qobj)
+            qobj.config = copy.deepcopy(first_qobj.config)
+            qobj.header = copy.deepcopy(first_qobj.header)
+            qobj.experiments = list(first_qobj.experiments)
             for idx in range(1, len(self._get_circuit_jobs())):
-                self._qobj.experiments.extend(self._sub_jobs[idx].qobj.experiments)
+                qobj.experiments.extend(self._sub_jobs[idx].qobj.experiments)
+            self._qobj = qobj
         return self._qobj
 
     def _get_circuit_jobs(self) -> List[IBMCircuitJob]:
@@ -15,7 +15,7 @@
 from typing import List, Optional
 
 from ..backendreservation import BackendReservation
-from ..utils.converters import utc_to_local
+from ..utils.converters import iso_utc_to_local
 
 
 def convert_reservation_data(
@@ -34,12 +34,12 @@ def convert_reservation_data(
     reservations = []
     for raw_res in raw_reservations:
         creation_datetime = raw_res.get('creationDate', None)
-        creation_datetime = utc_to_local(creation_datetime) if creation_datetime else None
+        creation_datetime = iso_utc_to_local(creation_datetime) if creation_datetime else None
         backend_name = backend_name or raw_res.get('backendName', None)
         reservations.append(BackendReservation(
             backend_name=backend_name,
-            start_datetime=utc_to_local(raw_res['initialDate']),
-            end_datetime=utc_to_local(raw_res['endDate']),
+            start_datetime=iso_utc_to_local(raw_res['initialDate']),
+            end_datetime=iso_utc_to_local(raw_res['endDate']),
             mode=raw_res.get('mode', None),
             reservation_id=raw_res.get('id', None),
             creation_datetime=creation_datetime,
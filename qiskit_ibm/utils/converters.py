@@ -12,13 +12,16 @@
 
 """Utilities related to conversion."""
 
-from typing import Union, Tuple, Any, Optional
+from typing import Union, Tuple, Optional
 from datetime import datetime, timedelta, timezone
 from math import ceil
 
 import dateutil.parser
 from dateutil import tz
 
+_LOCAL_TZ = tz.tzlocal()
+"""Local timezone, shared by the conversions instead of being rebuilt for each timestamp."""
+
 
 def utc_to_local(utc_dt: Union[datetime, str]) -> datetime:
     """Convert a UTC ``datetime`` object or string to a local timezone ``datetime``.
@@ -37,7 +40,7 @@ def utc_to_local(utc_dt: Union[datetime, str]) -> datetime:
     if not isinstance(utc_dt, datetime):
         raise TypeError('Input `utc_dt` is not string or datetime.')
     utc_dt = utc_dt.replace(tzinfo=timezone.utc)  # type: ignore[arg-type]
-    local_dt = utc_dt.astimezone(tz.tzlocal())  # type: ignore[attr-defined]
+    local_dt = utc_dt.astimezone(_LOCAL_TZ)  # type: ignore[attr-defined]
     return local_dt
 
 
@@ -60,7 +63,7 @@ def local_to_utc(local_dt: Union[datetime, str]) -> datetime:
 
     # Input is considered local if it's ``utcoffset()`` is ``None`` or none-zero.
     if local_dt.utcoffset() is None or local_dt.utcoffset() != timedelta(0):
-        local_dt = local_dt.replace(tzinfo=tz.tzlocal())
+        local_dt = local_dt.replace(tzinfo=_LOCAL_TZ)
         return local_dt.astimezone(tz.UTC)
     return local_dt  # Already in UTC.
 
@@ -99,27 +102,6 @@ def convert_tz(input_dt: Optional[datetime], to_utc: bool) -> Optional[datetime]
     return utc_to_local(input_dt)
 
 
-def utc_to_local_all(data: Any) -> Any:
-    """Recursively convert all ``datetime`` in the input data from local time to UTC.
-
-    Note:
-        Only lists and dictionaries are traversed.
-
-    Args:
-        data: Data to be converted.
-
-    Returns:
-        Converted data.
-    """
-    if isinstance(data, datetime):
-        return utc_to_local(data)
-    elif isinstance(data, list):
-        return [utc_to_local_all(elem) for elem in data]
-    elif isinstance(data, dict):
-        return {key: utc_to_local_all(elem) for key, elem in data.items()}
-    return data
-
-
 def str_to_utc(utc_dt: Optional[str]) -> Optional[datetime]:
     """Convert a UTC string to a ``datetime`` object with UTC timezone.
 
@@ -135,6 +117,21 @@ def str_to_utc(utc_dt: Optional[str]) -> Optional[datetime]:
     return parsed_dt.replace(tzinfo=timezone.utc)
 
 
+def iso_utc_to_local(utc_dt: str) -> datetime:
+    """Convert a UTC string in ISO format to a local timezone ``datetime``.
+
+    The server always returns ISO 8601 timestamps, so the strict ISO parser is
+    used instead of the much slower generic parser in :func:`utc_to_local`.
+
+    Args:
+        utc_dt: Input UTC string in ISO format.
+
+    Returns:
+        A ``datetime`` with the local timezone.
+    """
+    return utc_to_local(dateutil.parser.isoparse(utc_dt))
+
+
 def seconds_to_duration(seconds: float) -> Tuple[int, int, int, int, int]:
     """Converts seconds in a datetime delta to a duration.
 
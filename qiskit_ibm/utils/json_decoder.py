@@ -16,7 +16,7 @@ from typing import Dict, Union, List
 
 import dateutil.parser
 
-from .converters import utc_to_local
+from .converters import utc_to_local, iso_utc_to_local
 
 
 def decode_pulse_qobj(pulse_qobj: Dict) -> None:
@@ -51,18 +51,20 @@ def decode_pulse_defaults(defaults: Dict) -> None:
 def decode_backend_properties(properties: Dict) -> None:
     """Decode backend properties.
 
+    The UTC timestamps are converted to ``datetime`` objects in the local timezone.
+
     Args:
         properties: A ``BackendProperties`` in dictionary format.
     """
-    properties['last_update_date'] = dateutil.parser.isoparse(properties['last_update_date'])
+    properties['last_update_date'] = iso_utc_to_local(properties['last_update_date'])
     for qubit in properties['qubits']:
         for nduv in qubit:
-            nduv['date'] = dateutil.parser.isoparse(nduv['date'])
+            nduv['date'] = iso_utc_to_local(nduv['date'])
     for gate in properties['gates']:
         for param in gate['parameters']:
-            param['date'] = dateutil.parser.isoparse(param['date'])
+            param['date'] = iso_utc_to_local(param['date'])
     for gen in properties['general']:
-        gen['date'] = dateutil.parser.isoparse(gen['date'])
+        gen['date'] = iso_utc_to_local(gen['date'])
 
 
 def decode_backend_configuration(config: Dict) -> None:
@@ -15,10 +15,16 @@
 """Custom JSON encoders."""
 
 import json
-from typing import Any
+from typing import Any, Dict, Union
 
 from qiskit.circuit.parameterexpression import ParameterExpression
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 class IBMJsonEncoder(json.JSONEncoder):
     """A json encoder for qobj"""
@@ -37,3 +43,33 @@ class IBMJsonEncoder(json.JSONEncoder):
                 val = complex(o)
                 return val.real, val.imag
         return json.JSONEncoder.default(self, o)
+
+
+_ORJSON_DEFAULT = IBMJsonEncoder().default
+"""Fallback used by ``orjson`` for types it cannot serialize natively."""
+
+
+def dumps_qobj(qobj_dict: Dict[str, Any]) -> Union[str, bytes]:
+    """Serialize a ``Qobj`` dictionary to JSON.
+
+    ``orjson`` is used if it is installed, since it is considerably faster than
+    the standard library encoder for large ``Qobj``. Otherwise, or if ``orjson``
+    cannot encode the ``Qobj`` (for example, integers wider than 64 bits),
+    ``json`` with :class:`IBMJsonEncoder` is used.
+
+    Note:
+        ``orjson`` encodes ``NaN`` and infinite floats as ``null``.
+
+    Args:
+        qobj_dict: The ``Qobj`` to be serialized, in dictionary form.
+
+    Returns:
+        The JSON encoded ``Qobj``.
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(qobj_dict, default=_ORJSON_DEFAULT,
+                                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(qobj_dict, cls=IBMJsonEncoder)
@@ -17,6 +17,7 @@ import re
 import logging
 import keyword
 import copy
+from functools import lru_cache
 from typing import List, Optional, Type, Any, Dict, Union, Tuple
 from threading import Condition
 from queue import Queue
@@ -45,6 +46,7 @@ API_TO_JOB_STATUS = {
 }
 
 
+@lru_cache(maxsize=64)
 def api_status_to_job_status(api_status: Union[str, ApiJobStatus]) -> JobStatus:
     """Return the corresponding job status for the input server job status.
 
@@ -77,7 +77,8 @@ setuptools.setup(
                                       "seaborn>=0.9.0", "plotly>=4.4",
                                       "ipyvuetify>=1.1", "pyperclip>=1.7",
                                       "ipython>=5.0.0", "traitlets!=5.0.5",
-                                      "ipyvue>=1.4.1"]},
+                                      "ipyvue>=1.4.1"],
+                    'orjson': ['orjson>=3.0']},
     project_urls={
         "Bug Tracker": "https://github.com/Qiskit-Partners/qiskit-ibm/issues",
         "Documentation": "https://qiskit.org/documentation/",
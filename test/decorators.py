@@ -29,14 +29,31 @@
 import os
 from functools import wraps
 from unittest import SkipTest
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from qiskit.test.testing_options import get_test_options
 from qiskit_ibm import least_busy
 from qiskit_ibm import IBMProvider
+from qiskit_ibm.ibm_backend import IBMBackend
 from qiskit_ibm.credentials import (Credentials,
                                     discover_credentials)
 
+_USE_STAGING = bool(os.getenv('QISKIT_IBM_USE_STAGING_CREDENTIALS', ''))
+"""Whether the staging credentials and settings are used, read once at import time."""
+
+_HGP_ENV = 'QISKIT_IBM_STAGING_HGP' if _USE_STAGING else 'QISKIT_IBM_HGP'
+_PRIVATE_HGP_ENV = 'QISKIT_IBM_STAGING_PRIVATE_HGP' if _USE_STAGING else 'QISKIT_IBM_PRIVATE_HGP'
+_DEVICE_ENV = 'QISKIT_IBM_STAGING_DEVICE' if _USE_STAGING else 'QISKIT_IBM_DEVICE'
+_RUNTIME_DEVICE_ENV = 'QISKIT_IBM_STAGING_RUNTIME_DEVICE' if _USE_STAGING \
+    else 'QISKIT_IBM_RUNTIME_DEVICE'
+
+_ACTIVE_ACCOUNT: Optional[Tuple[str, str]] = None
+"""Token and url of the account last enabled by ``_enable_account``."""
+
+_BACKEND_CACHE: Dict[Tuple[str, str, Optional[str]], Tuple[IBMProvider, IBMBackend]] = {}
+"""Backends already resolved by ``_get_backend``, keyed by token, url and backend name,
+along with the default provider loaded when they were resolved."""
+
 
 def requires_qe_access(func):
     """Decorator that signals that the test uses the online API.
@@ -60,10 +77,7 @@ def requires_qe_access(func):
     """
     @wraps(func)
     def _wrapper(obj, *args, **kwargs):
-        if get_test_options()['skip_online']:
-            raise SkipTest('Skipping online tests')
-
-        credentials = _get_credentials()
+        credentials = _get_online_credentials()
         kwargs.update({'qe_token': credentials.token,
                        'qe_url': credentials.url})
 
@@ -75,7 +89,7 @@ def requires_qe_access(func):
 def requires_providers(func):
     """Decorator that signals the test uses the online API, via a public and premium provider.
 
-    This decorator delegates into the `requires_qe_access` decorator, but
+    This decorator performs the same checks as `requires_qe_access`, but
     instead of the credentials it appends a dictionary, containing the open access project
     `public_provider` and a `premium_provider`, to the decorated function.
 
@@ -86,10 +100,10 @@ def requires_providers(func):
         callable: The decorated function.
     """
     @wraps(func)
-    @requires_qe_access
     def _wrapper(*args, **kwargs):
-        qe_token = kwargs.pop('qe_token')
-        qe_url = kwargs.pop('qe_url')
+        credentials = _get_online_credentials()
+        qe_token = credentials.token
+        qe_url = credentials.url
 
         # Get the open access project public provider.
         public_provider = IBMProvider(qe_token, qe_url)
@@ -112,7 +126,7 @@ def requires_providers(func):
 def requires_provider(func):
     """Decorator that signals the test uses the online API, via a provider.
 
-    This decorator delegates into the `requires_qe_access` decorator, but
+    This decorator performs the same checks as `requires_qe_access`, but
     instead of the credentials it appends a `provider` argument to the decorated
     function.
 
@@ -123,12 +137,12 @@ def requires_provider(func):
         callable: the decorated function.
     """
     @wraps(func)
-    @requires_qe_access
     def _wrapper(*args, **kwargs):
-        token = kwargs.pop('qe_token')
-        url = kwargs.pop('qe_url')
+        credentials = _get_online_credentials()
+        token = credentials.token
+        url = credentials.url
         _enable_account(token, url)
-        provider = _get_custom_provider(token, url) or list(IBMProvider._providers.values())[0]
+        provider = _get_custom_provider(token, url) or next(iter(IBMProvider._providers.values()))
         kwargs.update({'provider': provider})
 
         return func(*args, **kwargs)
@@ -148,16 +162,14 @@ def requires_private_provider(func):
         callable: the decorated function.
     """
     @wraps(func)
-    @requires_qe_access
     def _wrapper(*args, **kwargs):
-        token = kwargs.pop('qe_token')
-        url = kwargs.pop('qe_url')
+        credentials = _get_online_credentials()
+        token = credentials.token
+        url = credentials.url
         _enable_account(token, url)
 
         # Get the private hub/group/project.
-        hgp = os.getenv('QISKIT_IBM_STAGING_PRIVATE_HGP', None) \
-            if os.getenv('QISKIT_IBM_USE_STAGING_CREDENTIALS', '') \
-            else os.getenv('QISKIT_IBM_PRIVATE_HGP', None)
+        hgp = os.getenv(_PRIVATE_HGP_ENV, None)
         if not hgp:
             raise SkipTest('Requires private provider.')
 
@@ -174,7 +186,7 @@ def requires_device(func):
     """Decorator that retrieves the appropriate backend to use for testing.
 
     It involves:
-        * Enable the account using credentials obtained from the
+        * Enable the account using credentials obtained the same way as the
             `requires_qe_access` decorator.
         * Use the backend specified by `QISKIT_IBM_STAGING_DEVICE` if
             `QISKIT_IBM_USE_STAGING_CREDENTIALS` is set, otherwise use the backend
@@ -190,15 +202,13 @@ def requires_device(func):
         callable: the decorated function.
     """
     @wraps(func)
-    @requires_qe_access
     def _wrapper(obj, *args, **kwargs):
+        credentials = _get_online_credentials()
 
-        backend_name = os.getenv('QISKIT_IBM_STAGING_DEVICE', None) \
-            if os.getenv('QISKIT_IBM_USE_STAGING_CREDENTIALS', '') \
-            else os.getenv('QISKIT_IBM_DEVICE', None)
+        backend_name = os.getenv(_DEVICE_ENV, None)
 
-        _backend = _get_backend(qe_token=kwargs.pop('qe_token'),
-                                qe_url=kwargs.pop('qe_url'),
+        _backend = _get_backend(qe_token=credentials.token,
+                                qe_url=credentials.url,
                                 backend_name=backend_name)
         kwargs.update({'backend': _backend})
         return func(obj, *args, **kwargs)
@@ -216,16 +226,14 @@ def requires_runtime_device(func):
         callable: the decorated function.
     """
     @wraps(func)
-    @requires_qe_access
     def _wrapper(obj, *args, **kwargs):
+        credentials = _get_online_credentials()
 
-        backend_name = os.getenv('QISKIT_IBM_STAGING_RUNTIME_DEVICE', None) \
-            if os.getenv('QISKIT_IBM_USE_STAGING_CREDENTIALS', '') \
-            else os.getenv('QISKIT_IBM_RUNTIME_DEVICE', None)
+        backend_name = os.getenv(_RUNTIME_DEVICE_ENV, None)
         if not backend_name:
             raise SkipTest("Runtime device not specified")
-        _backend = _get_backend(qe_token=kwargs.pop('qe_token'),
-                                qe_url=kwargs.pop('qe_url'),
+        _backend = _get_backend(qe_token=credentials.token,
+                                qe_url=credentials.url,
                                 backend_name=backend_name)
         kwargs.update({'backend': _backend})
         return func(obj, *args, **kwargs)
@@ -237,16 +245,27 @@ def _get_backend(qe_token, qe_url, backend_name):
     """Get the specified backend."""
     _enable_account(qe_token, qe_url)
 
+    default_provider = next(iter(IBMProvider._providers.values()))
+    cache_key = (qe_token, qe_url, backend_name)
+    cached = _BACKEND_CACHE.get(cache_key)
+    # Tests may rebuild the providers, which discards the cached backends' providers.
+    if cached and cached[0] is default_provider:
+        return cached[1]
+
     _backend = None
-    provider = _get_custom_provider(qe_token, qe_url) or list(IBMProvider._providers.values())[0]
+    provider = _get_custom_provider(qe_token, qe_url) or default_provider
 
     if backend_name:
         # Put desired provider as the first in the list.
         providers = [provider] + IBMProvider._get_providers()
-        for provider in providers:
-            backends = provider.backends(name=backend_name)
-            if backends:
-                _backend = backends[0]
+        for prov in providers:
+            # Look the backend up by name directly instead of filtering all of them,
+            # falling back to the filter to resolve aliased and deprecated names.
+            _backend = prov._backends.get(backend_name)
+            if not _backend:
+                backends = prov.backends(name=backend_name)
+                _backend = backends[0] if backends else None
+            if _backend:
                 break
     else:
         _backend = least_busy(provider.backends(
@@ -255,9 +274,25 @@ def _get_backend(qe_token, qe_url, backend_name):
     if not _backend:
         raise Exception('Unable to find a suitable backend.')
 
+    _BACKEND_CACHE[cache_key] = (default_provider, _backend)
     return _backend
 
 
+def _get_online_credentials():
+    """Skip the test if online tests are disabled, otherwise find its credentials.
+
+    Returns:
+        Credentials: set of credentials
+
+    Raises:
+        SkipTest: When online tests are to be skipped.
+    """
+    if get_test_options()['skip_online']:
+        raise SkipTest('Skipping online tests')
+
+    return _get_credentials()
+
+
 def _get_credentials():
     """Finds the credentials for a specific test and options.
 
@@ -268,7 +303,7 @@ def _get_credentials():
         Exception: When the credential could not be set and they are needed
             for that set of options.
     """
-    if os.getenv('QISKIT_IBM_USE_STAGING_CREDENTIALS', ''):
+    if _USE_STAGING:
         # Special case: instead of using the standard credentials mechanism,
         # load them from different environment variables. This assumes they
         # will always be in place, as is used by the CI setup.
@@ -302,9 +337,7 @@ def _get_custom_provider(token: str, url: str) -> Optional[IBMProvider]:
     Returns:
         Custom provider or ``None`` if default is to be used.
     """
-    hgp = os.getenv('QISKIT_IBM_STAGING_HGP', None) \
-        if os.getenv('QISKIT_IBM_USE_STAGING_CREDENTIALS', '') \
-        else os.getenv('QISKIT_IBM_HGP', None)
+    hgp = os.getenv(_HGP_ENV, None)
     if hgp:
         hgp = hgp.split('/')
         return IBMProvider(token=token, url=url, hub=hgp[0], group=hgp[1], project=hgp[2])
@@ -318,9 +351,18 @@ def _enable_account(qe_token: str, qe_url: str) -> None:
         qe_token: API token.
         qe_url: API URL.
     """
+    global _ACTIVE_ACCOUNT  # pylint: disable=global-statement
+    # Tests disabling the account leave no providers behind, so only trust the
+    # cached account while some are still loaded.
+    if _ACTIVE_ACCOUNT == (qe_token, qe_url) and IBMProvider._providers:
+        return
+
     active_account = IBMProvider.active_account()
     if active_account:
         if active_account.get('token', '') == qe_token:
+            _ACTIVE_ACCOUNT = (qe_token, qe_url)
             return
         IBMProvider._disable_account()
     IBMProvider(qe_token, qe_url)
+    _ACTIVE_ACCOUNT = (qe_token, qe_url)
+    _BACKEND_CACHE.clear()
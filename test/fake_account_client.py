@@ -15,6 +15,7 @@
 # TODO This can probably be merged with the one in test_ibm_job_states
 import time
 import copy
+import threading
 from random import randrange
 import uuid
 from concurrent.futures import ThreadPoolExecutor, wait
@@ -54,6 +55,16 @@ VALID_RESULT = {
     }
 }
 
+VALID_BACKEND_PROPERTIES = {
+    'backend_name': 'fake_backend',
+    'backend_version': '1.0.0',
+    'last_update_date': '2021-01-01T00:00:00Z',
+    'qubits': [],
+    'gates': [],
+    'general': []
+}
+"""Valid backend properties response."""
+
 API_STATUS_TO_INT = {
     ApiJobStatus.CREATING: 0,
     ApiJobStatus.VALIDATING: 1,
@@ -325,6 +336,7 @@ class BaseFakeAccountClient:
         self._est_completion.reverse()
         self._run_mode = run_mode
         self._default_job_class = BaseFakeJob
+        self._job_submit_lock = threading.Lock()
 
     def list_jobs_statuses(self, limit, skip, descending=True, extra_filter=None):
         """Return a list of statuses of jobs."""
@@ -345,39 +357,40 @@ class BaseFakeAccountClient:
     def job_submit(self, backend_name, qobj_dict, job_name,
                    job_tags, experiment_id, *_args, **_kwargs):
         """Submit a Qobj to a device."""
-        if self._job_limit != -1 and self._unfinished_jobs() >= self._job_limit:
-            raise RequestsApiError(
-                '400 Client Error: Bad Request for url: <url>.  Reached '
-                'maximum number of concurrent jobs, Error code: 3458.')
-
-        new_job_id = uuid.uuid4().hex
-        if isinstance(self._job_class, list):
-            job_class = self._job_class.pop() if self._job_class else self._default_job_class
-        else:
-            job_class = self._job_class
-        job_kwargs = copy.copy(self._job_kwargs)
-        if self._queue_positions:
-            job_kwargs['queue_pos'] = self._queue_positions.pop()
-        if self._est_completion:
-            job_kwargs['est_completion'] = self._est_completion.pop()
-
-        run_mode = self._run_mode
-        if run_mode == 'dedicated_once':
-            run_mode = 'dedicated'
-            self._run_mode = 'fairshare'
-
-        new_job = job_class(
-            executor=self._executor,
-            job_id=new_job_id,
-            qobj=qobj_dict,
-            backend_name=backend_name,
-            job_tags=job_tags,
-            job_name=job_name,
-            experiment_id=experiment_id,
-            run_mode=run_mode,
-            **job_kwargs)
-        self._jobs[new_job_id] = new_job
-        return new_job.data()
+        with self._job_submit_lock:
+            if self._job_limit != -1 and self._unfinished_jobs() >= self._job_limit:
+                raise RequestsApiError(
+                    '400 Client Error: Bad Request for url: <url>.  Reached '
+                    'maximum number of concurrent jobs, Error code: 3458.')
+
+            new_job_id = uuid.uuid4().hex
+            if isinstance(self._job_class, list):
+                job_class = self._job_class.pop() if self._job_class else self._default_job_class
+            else:
+                job_class = self._job_class
+            job_kwargs = copy.copy(self._job_kwargs)
+            if self._queue_positions:
+                job_kwargs['queue_pos'] = self._queue_positions.pop()
+            if self._est_completion:
+                job_kwargs['est_completion'] = self._est_completion.pop()
+
+            run_mode = self._run_mode
+            if run_mode == 'dedicated_once':
+                run_mode = 'dedicated'
+                self._run_mode = 'fairshare'
+
+            new_job = job_class(
+                executor=self._executor,
+                job_id=new_job_id,
+                qobj=qobj_dict,
+                backend_name=backend_name,
+                job_tags=job_tags,
+                job_name=job_name,
+                experiment_id=experiment_id,
+                run_mode=run_mode,
+                **job_kwargs)
+            self._jobs[new_job_id] = new_job
+            return new_job.data()
 
     def job_download_qobj(self, job_id, *_args, **_kwargs):
         """Retrieve and return a Qobj."""
@@ -480,6 +493,70 @@ class JobSubmitFailClient(BaseFakeAccountClient):
         return super().job_submit(*_args, **_kwargs)
 
 
+class SlowSubmitClient(BaseFakeAccountClient):
+    """Fake AccountClient used to track the number of concurrent job submits."""
+
+    def __init__(self, *args, submit_time=0.5, **kwargs):
+        """SlowSubmitClient constructor."""
+        self._submit_time = submit_time
+        self._submit_lock = threading.Lock()
+        self._active_submits = 0
+        self.max_active_submits = 0
+        self.active_submits_history = []
+        super().__init__(*args, **kwargs)
+
+    def job_submit(self, *_args, **_kwargs):  # pylint: disable=arguments-differ
+        """Slow job submit."""
+        with self._submit_lock:
+            self._active_submits += 1
+            self.max_active_submits = max(self.max_active_submits, self._active_submits)
+            self.active_submits_history.append(self._active_submits)
+        try:
+            time.sleep(self._submit_time)
+            return super().job_submit(*_args, **_kwargs)
+        finally:
+            with self._submit_lock:
+                self._active_submits -= 1
+
+
+class BackendDataClient(BaseFakeAccountClient):
+    """Fake AccountClient used to count backend properties and defaults queries."""
+
+    def __init__(self, *args, properties=None, **kwargs):
+        """BackendDataClient constructor."""
+        self._properties = properties or VALID_BACKEND_PROPERTIES
+        self.properties_calls = 0
+        self.defaults_calls = 0
+        super().__init__(*args, **kwargs)
+
+    def backend_properties(self, *_args, **_kwargs):
+        """Return the backend properties."""
+        self.properties_calls += 1
+        return copy.deepcopy(self._properties)
+
+    def backend_pulse_defaults(self, *_args, **_kwargs):
+        """Return no pulse defaults."""
+        self.defaults_calls += 1
+        return None
+
+
+class ApiErrorClient(BaseFakeAccountClient):
+    """Fake AccountClient used to fail job submits and retrievals with an API error."""
+
+    def __init__(self, message, *args, **kwargs):
+        """ApiErrorClient constructor."""
+        self._message = message
+        super().__init__(*args, **kwargs)
+
+    def job_submit(self, *_args, **_kwargs):  # pylint: disable=arguments-differ
+        """Failing job submit."""
+        raise RequestsApiError(self._message)
+
+    def job_get(self, *_args, **_kwargs):
+        """Failing job retrieval."""
+        raise RequestsApiError(self._message)
+
+
 class JobTimeoutClient(BaseFakeAccountClient):
     """Fake AccountClient used to fail a job submit."""
 
@@ -220,6 +220,26 @@ class TestAccountClientJobs(IBMTestCase):
             self.assertNotEqual(job['job_id'], self.job_id)
 
 
+class TestRequestsApiError(IBMTestCase):
+    """Tests for RequestsApiError."""
+
+    def test_error_code(self):
+        """Test extracting the error code from the error message."""
+        sub_tests = [
+            ('400 Client Error: Bad Request for url: <url>. Reached maximum number of '
+             'concurrent jobs, Error code: 3458.', 3458),
+            ('Job not found. Error code: 3250.', 3250),
+            ('Job submit failed!', None)
+        ]
+        for message, error_code in sub_tests:
+            with self.subTest(message=message):
+                self.assertEqual(RequestsApiError(message).error_code, error_code)
+
+    def test_api_error_no_error_code(self):
+        """Test API errors default to having no error code."""
+        self.assertIsNone(ApiError('Job not found. Error code: 3250.').error_code)
+
+
 class TestAuthClient(IBMTestCase):
     """Tests for the AuthClient."""
 
@@ -17,7 +17,9 @@ import copy
 import time
 import random
 import uuid
+import threading
 from datetime import datetime, timedelta, timezone
+from unittest import mock
 from dateutil import tz
 
 from qiskit import transpile
@@ -37,7 +39,8 @@ from ..ibm_test_case import IBMTestCase
 from ..decorators import requires_provider
 from ..fake_account_client import (BaseFakeAccountClient, CancelableFakeJob,
                                    JobSubmitFailClient, BaseFakeJob, FailedFakeJob,
-                                   JobTimeoutClient, FixedStatusFakeJob, MissingFieldFakeJob)
+                                   JobTimeoutClient, FixedStatusFakeJob, MissingFieldFakeJob,
+                                   SlowSubmitClient)
 
 
 class TestIBMCompositeJob(IBMTestCase):
@@ -75,6 +78,12 @@ class TestIBMCompositeJob(IBMTestCase):
         self.fake_backend._api_client = fake_client
         self.fake_provider._api_client = fake_client
 
+    def _submit_in_order(self):
+        """Submit sub-jobs one at a time, for fake clients that hand out jobs in order."""
+        patcher = mock.patch.object(IBMCompositeJob, '_max_concurrent_submits', 1)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     def test_split_circuits(self):
         """Test having circuits split into multiple jobs."""
         max_circs = self.fake_backend.configuration().max_experiments
@@ -94,8 +103,36 @@ class TestIBMCompositeJob(IBMTestCase):
         job_set = self.fake_backend.run([self._qc] * 2, max_circuits_per_job=1)
         self.assertEqual(len(job_set.sub_jobs()), 2)
 
+    def test_concurrent_submit(self):
+        """Test sub-jobs being submitted concurrently."""
+        client = SlowSubmitClient()
+        self._set_fake_client(client)
+        with mock.patch.object(IBMCompositeJob, '_max_concurrent_submits', 2):
+            job_set = self.fake_backend.run([self._qc] * 4, max_circuits_per_job=1)
+            job_set.block_for_submit()
+        self.assertEqual(len(job_set.sub_jobs()), 4)
+        self.assertEqual(client.max_active_submits, 2)
+
+    def test_concurrent_submit_simultaneous_finish(self):
+        """Test concurrent submits staying at the limit when sub-jobs finish together."""
+        max_submits = 4
+        client = SlowSubmitClient()
+        self._set_fake_client(client)
+        with mock.patch.object(IBMCompositeJob, '_max_concurrent_submits', max_submits):
+            job_set = self.fake_backend.run([self._qc] * max_submits * 2,
+                                            max_circuits_per_job=1)
+            job_set.block_for_submit()
+
+        self.assertEqual(len(job_set.sub_jobs()), max_submits * 2)
+        for circ_idx in range(max_submits * 2):
+            self.assertIsNotNone(job_set.sub_job(circ_idx))
+        self.assertEqual(client.max_active_submits, max_submits)
+        # Every sub-job of the first batch wakes a different one of the second batch.
+        self.assertEqual(max(client.active_submits_history[max_submits:]), max_submits)
+
     def test_job_report(self):
         """Test job report."""
+        self._submit_in_order()
         job_classes = [BaseFakeJob, FailedFakeJob, CancelableFakeJob, CancelableFakeJob,
                        FixedStatusFakeJob]
         job_count = len(job_classes)
@@ -130,6 +167,7 @@ class TestIBMCompositeJob(IBMTestCase):
 
     def test_job_pending_status(self):
         """Test pending and running status."""
+        self._submit_in_order()
         sub_tests = [(ApiJobStatus.VALIDATING, JobStatus.VALIDATING, 'Pending'),
                      (ApiJobStatus.RUNNING, JobStatus.RUNNING, 'Running'),
                      (ApiJobStatus.QUEUED, JobStatus.QUEUED, 'Pending')]
@@ -241,6 +279,7 @@ class TestIBMCompositeJob(IBMTestCase):
 
     def test_error_message_one(self):
         """Test error message when one job failed."""
+        self._submit_in_order()
         failure_types = ['validation', 'partial', 'result']
         for fail_type in failure_types:
             with self.subTest(fail_type=fail_type):
@@ -277,6 +316,7 @@ class TestIBMCompositeJob(IBMTestCase):
 
     def test_async_submit_exception(self):
         """Test asynchronous job submit failed."""
+        self._submit_in_order()
         self.fake_backend._api_client = JobSubmitFailClient(failed_indexes=0)
 
         job_set = self.fake_backend.run([self._qc] * 2, max_circuits_per_job=1)
@@ -340,6 +380,38 @@ class TestIBMCompositeJob(IBMTestCase):
         finally:
             job_set.cancel()
 
+    def test_job_limit_concurrent_submit(self):
+        """Test reaching job limit while sub-jobs are submitted concurrently."""
+        job_limit = 2
+        self._set_fake_client(BaseFakeAccountClient(job_limit=job_limit))
+
+        wait_lock = threading.Lock()
+        waiting = []
+        max_waiting = []
+        original_wait = IBMCompositeJob._wait_for_oldest_job
+
+        def _track_wait(job_set):
+            with wait_lock:
+                waiting.append(job_set)
+                max_waiting.append(len(waiting))
+            try:
+                original_wait(job_set)
+            finally:
+                with wait_lock:
+                    waiting.remove(job_set)
+
+        with mock.patch.object(IBMCompositeJob, '_wait_for_oldest_job',
+                               autospec=True, side_effect=_track_wait):
+            job_set = self.fake_backend.run([self._qc] * (job_limit + 4),
+                                            max_circuits_per_job=1)
+            job_set.wait_for_final_state(timeout=60)
+
+        self.assertEqual(job_set.status(), JobStatus.DONE)
+        self.assertEqual(len(job_set.sub_jobs()), job_limit + 4)
+        self.assertTrue(max_waiting)
+        # Only one sub-job at a time waits for the job limit to clear.
+        self.assertEqual(max(max_waiting), 1)
+
     def test_job_tags_replace(self):
         """Test updating job tags by replacing existing tags."""
         initial_job_tags = [uuid.uuid4().hex]
@@ -366,6 +438,7 @@ class TestIBMCompositeJob(IBMTestCase):
 
     def test_skipped_result(self):
         """Test one of the jobs has no result."""
+        self._submit_in_order()
         sub_tests = [CancelableFakeJob, FailedFakeJob]
         for job_class in sub_tests:
             with self.subTest(job_class=job_class):
@@ -387,6 +460,7 @@ class TestIBMCompositeJob(IBMTestCase):
 
     def test_partial_result(self):
         """Test one of the circuits has no result."""
+        self._submit_in_order()
         self.fake_backend._api_client = BaseFakeAccountClient(
             job_class=[BaseFakeJob, FailedFakeJob], job_kwargs={'failure_type': 'partial'})
         job_set = self.fake_backend.run([self._qc] * 4, max_circuits_per_job=2)
@@ -448,6 +522,7 @@ class TestIBMCompositeJob(IBMTestCase):
 
     def test_time_per_step_running(self):
         """Test retrieving time per step when job is running."""
+        self._submit_in_order()
         self._set_fake_client(
             BaseFakeAccountClient(job_class=[BaseFakeJob, FixedStatusFakeJob],
                                   job_kwargs={'fixed_status': ApiJobStatus.RUNNING}))
@@ -467,6 +542,7 @@ class TestIBMCompositeJob(IBMTestCase):
 
     def test_time_per_step_error(self):
         """Test retrieving time per step when job failed."""
+        self._submit_in_order()
         self._set_fake_client(BaseFakeAccountClient(job_class=[BaseFakeJob, FailedFakeJob]))
         job_set = self.fake_backend.run([self._qc] * 2, max_circuits_per_job=1)
         job_set.wait_for_final_state()
@@ -483,6 +559,7 @@ class TestIBMCompositeJob(IBMTestCase):
 
     def test_queue_info(self):
         """Test retrieving queue information."""
+        self._submit_in_order()
         ts1 = datetime.now() + timedelta(minutes=5)
         ts2 = datetime.now() + timedelta(minutes=10)
         sub_tests = [  # Queue positions and expected position/completion time.
@@ -539,6 +616,7 @@ class TestIBMCompositeJob(IBMTestCase):
 
     def test_missing_required_fields(self):
         """Test response data is missing required fields."""
+        self._submit_in_order()
         self._set_fake_client(BaseFakeAccountClient(job_class=[BaseFakeJob, MissingFieldFakeJob]))
         job_set = self.fake_backend.run([self._qc] * 2, max_circuits_per_job=1)
         job_set.wait_for_final_state()
@@ -606,6 +684,7 @@ class TestIBMCompositeJob(IBMTestCase):
 
     def test_retry_failed_submit(self):
         """Test retrying failed job submit."""
+        self._submit_in_order()
         max_circs = self.fake_backend.configuration().max_experiments
         circs = []
         count = 3
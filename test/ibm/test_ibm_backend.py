@@ -12,16 +12,29 @@
 
 """IBMBackend Test."""
 
+import time
+import uuid
+import warnings
 from datetime import timedelta, datetime
 from unittest import SkipTest
-from unittest.mock import patch
+from unittest.mock import patch, Mock
 
 from qiskit import QuantumCircuit
+from qiskit.circuit.duration import duration_in_dt
+from qiskit.pulse import Schedule
 from qiskit.providers.models import QasmBackendConfiguration
+from qiskit.test.mock.backends.bogota.fake_bogota import FakeBogota
 from qiskit.test.reference_circuits import ReferenceCircuits
 
+from qiskit_ibm.exceptions import IBMBackendApiError, IBMBackendJobLimitError
+from qiskit_ibm.ibm_backend import IBMBackend, BACKEND_CACHE_TTL
+from qiskit_ibm.ibm_backend_service import IBMBackendService
+from qiskit_ibm.job.exceptions import IBMJobNotFoundError
+
 from ..ibm_test_case import IBMTestCase
 from ..decorators import requires_device, requires_provider
+from ..fake_account_client import (BackendDataClient, ApiErrorClient,
+                                   VALID_BACKEND_PROPERTIES)
 from ..utils import get_pulse_schedule, cancel_job
 
 
@@ -165,7 +178,8 @@ class TestIBMBackend(IBMTestCase):
             coupling_map=None,
         )
 
-        with patch.object(self.backend, 'configuration', return_value=config):
+        with patch.object(self.backend, 'configuration', return_value=config), \
+                patch.object(IBMBackend, 'id_warning_issued', False):
             with self.assertWarnsRegex(DeprecationWarning, r"'id' instruction"):
                 self.backend._deprecate_id_instruction(circuit_with_id)
 
@@ -192,3 +206,238 @@ class TestIBMBackendService(IBMTestCase):
                 self.assertIsNotNone(
                     getattr(reserv, attr),
                     "Reservation {} is missing attribute {}".format(reserv, attr))
+
+
+class TestIBMBackendCache(IBMTestCase):
+    """Test the backend properties and pulse defaults caches."""
+
+    def setUp(self):
+        """Initial test setup."""
+        super().setUp()
+        self.client = BackendDataClient()
+        self.backend = _get_fake_backend(self, self.client)
+
+    def _get_backend(self):
+        """Return another instance of the same backend."""
+        return _get_fake_backend(self, self.client, self.backend._credentials)
+
+    def test_shared_between_instances(self):
+        """Test instances of the same backend sharing the cached data."""
+        other_backend = self._get_backend()
+        self.assertIs(self.backend.properties(), other_backend.properties())
+        self.assertEqual(self.client.properties_calls, 1)
+        self.backend.defaults()
+        other_backend.defaults()
+        self.assertEqual(self.client.defaults_calls, 1)
+
+    def test_cache_expired(self):
+        """Test the cached data being re-queried after it expires."""
+        self.backend.properties()
+        self.backend.defaults()
+        with patch.object(time, 'monotonic', return_value=time.monotonic() + BACKEND_CACHE_TTL):
+            self.backend.properties()
+            self.backend.defaults()
+        self.assertEqual(self.client.properties_calls, 2)
+        self.assertEqual(self.client.defaults_calls, 2)
+
+    def test_refresh(self):
+        """Test refresh bypassing the cache."""
+        self.backend.properties()
+        self.backend.properties(refresh=True)
+        self.backend.defaults()
+        self.backend.defaults(refresh=True)
+        self.assertEqual(self.client.properties_calls, 2)
+        self.assertEqual(self.client.defaults_calls, 2)
+
+        # The refreshed data is cached.
+        self.backend.properties()
+        self.backend.defaults()
+        self.assertEqual(self.client.properties_calls, 2)
+        self.assertEqual(self.client.defaults_calls, 2)
+
+    def test_datetime_not_cached(self):
+        """Test properties for a datetime bypassing the cache without being stored."""
+        self.backend.properties()
+        self.backend.properties(datetime=datetime.now())
+        self.assertEqual(self.client.properties_calls, 2)
+
+        self.backend.invalidate_caches()
+        self.backend.properties(datetime=datetime.now())
+        self.backend.properties()
+        self.assertEqual(self.client.properties_calls, 4)
+
+    def test_invalidate_caches(self):
+        """Test invalidating the caches forcing a re-query."""
+        self.backend.properties()
+        self.backend.defaults()
+        self._get_backend().invalidate_caches()
+        self.backend.properties()
+        self.backend.defaults()
+        self.assertEqual(self.client.properties_calls, 2)
+        self.assertEqual(self.client.defaults_calls, 2)
+
+    def test_none_defaults_cached(self):
+        """Test a backend without pulse defaults being cached."""
+        self.assertIsNone(self.backend.defaults())
+        self.assertIsNone(self.backend.defaults())
+        self.assertEqual(self.client.defaults_calls, 1)
+
+
+class TestIBMBackendArguments(IBMTestCase):
+    """Test validating IBMBackend method arguments."""
+
+    def setUp(self):
+        """Initial test setup."""
+        super().setUp()
+        self.client = BackendDataClient()
+        self.backend = _get_fake_backend(self, self.client)
+
+    def test_properties_invalid_refresh(self):
+        """Test properties with a refresh value that is not a boolean."""
+        with self.assertRaisesRegex(TypeError, "The 'refresh' argument needs to be a boolean. "
+                                               "1 is of type <class 'int'>"):
+            self.backend.properties(refresh=1)
+        self.assertEqual(self.client.properties_calls, 0)
+
+    def test_properties_invalid_datetime(self):
+        """Test properties with a datetime value that is not a datetime."""
+        with self.assertRaisesRegex(TypeError, "'2021-01-01' is not of type 'datetime'."):
+            self.backend.properties(datetime='2021-01-01')
+        self.assertEqual(self.client.properties_calls, 0)
+
+    def test_reservations_invalid_datetime(self):
+        """Test reservations with start or end values that are not datetimes."""
+        for arg_name in ['start_datetime', 'end_datetime']:
+            with self.subTest(arg_name=arg_name):
+                with self.assertRaisesRegex(TypeError,
+                                            "'2021-01-01' is not of type 'datetime'."):
+                    self.backend.reservations(**{arg_name: '2021-01-01'})
+
+
+class TestIBMBackendApiErrors(IBMTestCase):
+    """Test handling API errors with known error codes."""
+
+    def test_submit_job_limit(self):
+        """Test submitting a job when the job limit is reached."""
+        backend = _get_fake_backend(self, ApiErrorClient(
+            'Reached maximum number of concurrent jobs, Error code: 3458.'))
+        with self.assertRaises(IBMBackendJobLimitError):
+            backend._submit_job(Mock())
+
+    def test_submit_job_error(self):
+        """Test submitting a job failing with another error."""
+        backend = _get_fake_backend(self, ApiErrorClient('Job submit failed!'))
+        with self.assertRaises(IBMBackendApiError):
+            backend._submit_job(Mock())
+
+    def test_job_not_found(self):
+        """Test retrieving a job that does not exist."""
+        client = ApiErrorClient('Job not found. Error code: 3250.')
+        self.addCleanup(client.tear_down)
+        service = IBMBackendService(Mock(_backends={}, _api_client=client))
+        with self.assertRaises(IBMJobNotFoundError):
+            service.job('1234')
+
+    def test_job_error(self):
+        """Test retrieving a job failing with another error."""
+        client = ApiErrorClient('Failed to get job.')
+        self.addCleanup(client.tear_down)
+        service = IBMBackendService(Mock(_backends={}, _api_client=client))
+        with self.assertRaises(IBMBackendApiError):
+            service.job('1234')
+
+
+class TestDeprecateIdInstruction(IBMTestCase):
+    """Test replacing 'id' instructions with 'delay' instructions offline."""
+
+    # Length, in ns, of the 'sx' gate on each qubit.
+    SX_LENGTHS = {0: 35.5, 1: 71.1}
+
+    def setUp(self):
+        """Initial test setup."""
+        super().setUp()
+        properties = dict(VALID_BACKEND_PROPERTIES, gates=[
+            {'qubits': [qubit], 'gate': 'sx', 'name': f'sx{qubit}',
+             'parameters': [{'date': '2021-01-01T00:00:00Z', 'name': 'gate_length',
+                             'unit': 'ns', 'value': length}]}
+            for qubit, length in self.SX_LENGTHS.items()])
+        self.client = BackendDataClient(properties=properties)
+        self.backend = self._get_backend()
+        # The warning is tested separately.
+        patcher = patch.object(IBMBackend, 'id_warning_issued', True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _get_backend(self):
+        """Return a backend supporting both 'id' and 'delay' instructions."""
+        backend = _get_fake_backend(self, self.client)
+        config = backend.configuration()
+        config.basis_gates = ['id', 'rz', 'sx', 'x', 'cx']
+        config.supported_instructions = ['delay']
+        return backend
+
+    def _expected_duration(self, qubit):
+        """Return the expected 'delay' duration replacing an 'id' on the qubit."""
+        return duration_in_dt(self.SX_LENGTHS[qubit] * 1e-9, self.backend.configuration().dt)
+
+    def test_replace_in_batch(self):
+        """Test replacing 'id' instructions in several circuits and a schedule."""
+        circ1 = QuantumCircuit(2)
+        circ1.id(0)
+        circ1.id(1)
+        circ1.id(0)
+        circ2 = QuantumCircuit(2)
+        circ2.x(0)
+        circ2.id(1)
+        schedule = Schedule()
+
+        self.backend._deprecate_id_instruction([circ1, schedule, circ2])
+
+        self.assertEqual(circ1.count_ops(), {'delay': 3})
+        self.assertEqual(circ2.count_ops(), {'x': 1, 'delay': 1})
+        for circ in [circ1, circ2]:
+            for instr, qargs, _ in circ.data:
+                if instr.name == 'delay':
+                    self.assertEqual(instr.params[0],
+                                     self._expected_duration(qargs[0].index))
+        self.assertEqual(len(schedule.instructions), 0)
+        self.assertEqual(self.client.properties_calls, 1)
+
+    def test_no_id(self):
+        """Test backend properties are not retrieved without 'id' instructions."""
+        circ = QuantumCircuit(1)
+        circ.x(0)
+        self.backend._deprecate_id_instruction([circ, Schedule()])
+        self.backend._deprecate_id_instruction(Schedule())
+        self.assertEqual(circ.count_ops(), {'x': 1})
+        self.assertEqual(self.client.properties_calls, 0)
+
+    def test_warning_once(self):
+        """Test the deprecation warning being issued once per process."""
+        circ = QuantumCircuit(1)
+        circ.id(0)
+        with patch.object(IBMBackend, 'id_warning_issued', False):
+            with self.assertWarnsRegex(DeprecationWarning, r"'id' instruction"):
+                self.backend._deprecate_id_instruction(circ.copy())
+
+            other_backend = self._get_backend()
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter('always')
+                other_backend._deprecate_id_instruction(circ.copy())
+            self.assertFalse([warn for warn in caught
+                              if issubclass(warn.category, DeprecationWarning)
+                              and "'id' instruction" in str(warn.message)])
+
+
+def _get_fake_backend(test_case, client, credentials=None):
+    """Return a ``FakeBogota`` based backend using the fake client.
+
+    A unique server url is used unless `credentials` are given, so the backend
+    caches are not shared with other tests. The client is torn down and the
+    caches discarded when the test finishes.
+    """
+    credentials = credentials or Mock(base_url=f'https://{uuid.uuid4().hex}')
+    backend = IBMBackend(FakeBogota().configuration(), Mock(), credentials, api_client=client)
+    test_case.addCleanup(client.tear_down)
+    test_case.addCleanup(backend.invalidate_caches)
+    return backend
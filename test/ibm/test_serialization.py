@@ -12,10 +12,12 @@
 
 """Test serializing and deserializing data sent to the server."""
 
-from unittest import SkipTest, skipIf
+import json
+from unittest import SkipTest, skipIf, mock
 from typing import Any, Dict, Optional
 
 import dateutil.parser
+import numpy as np
 from qiskit.test.reference_circuits import ReferenceCircuits
 from qiskit.test import slow_test
 from qiskit import transpile, schedule, QuantumCircuit
@@ -23,7 +25,8 @@ from qiskit.circuit import Parameter
 from qiskit.version import VERSION as terra_version
 
 from qiskit_ibm import least_busy
-from qiskit_ibm.utils.json_encoder import IBMJsonEncoder
+from qiskit_ibm.utils import json_encoder
+from qiskit_ibm.utils.json_encoder import IBMJsonEncoder, dumps_qobj
 
 from ..decorators import requires_provider
 from ..utils import cancel_job
@@ -179,6 +182,60 @@ class TestSerialization(IBMTestCase):
         self.assertEqual(val[1], 0.1)
 
 
+class TestQobjEncoding(IBMTestCase):
+    """Test encoding Qobj for upload."""
+
+    @skipIf(terra_version < '0.17', "Need Terra >= 0.17")
+    def test_dumps_qobj(self):
+        """Verify that Qobj values are encoded with and without orjson."""
+        param = Parameter('test')
+        qobj_dict = {
+            'config': {'shots': 1024, 'qubit_lo_freq': np.array([4.9, 5.1])},
+            'experiments': [{
+                'instructions': [
+                    {'name': 'u1', 'params': [param.bind({param: 0.5})]},
+                    {'name': 'unitary', 'params': [np.array([[1, 0], [0, 1j]])]},
+                    {'name': 'parametric_pulse', 'parameters': {'amp': 0.2+0.1j}}
+                ]
+            }]
+        }
+        expected = {
+            'config': {'shots': 1024, 'qubit_lo_freq': [4.9, 5.1]},
+            'experiments': [{
+                'instructions': [
+                    {'name': 'u1', 'params': [0.5]},
+                    {'name': 'unitary', 'params': [[[[1.0, 0.0], [0.0, 0.0]],
+                                                    [[0.0, 0.0], [0.0, 1.0]]]]},
+                    {'name': 'parametric_pulse', 'parameters': {'amp': [0.2, 0.1]}}
+                ]
+            }]
+        }
+        for has_orjson in (True, False):
+            with self.subTest(has_orjson=has_orjson), \
+                    mock.patch.object(json_encoder, 'HAS_ORJSON', has_orjson):
+                if has_orjson and not json_encoder.HAS_ORJSON:
+                    self.skipTest('orjson is not installed.')
+                self.assertEqual(json.loads(dumps_qobj(qobj_dict)), expected)
+
+    def test_dumps_qobj_large_int(self):
+        """Verify that integers wider than 64 bits are encoded."""
+        qobj_dict = {'config': {'seed_simulator': 2**70}}
+        for has_orjson in (True, False):
+            with self.subTest(has_orjson=has_orjson), \
+                    mock.patch.object(json_encoder, 'HAS_ORJSON', has_orjson):
+                if has_orjson and not json_encoder.HAS_ORJSON:
+                    self.skipTest('orjson is not installed.')
+                self.assertEqual(json.loads(dumps_qobj(qobj_dict)), qobj_dict)
+
+    @skipIf(not json_encoder.HAS_ORJSON, "Need orjson")
+    def test_dumps_qobj_non_finite(self):
+        """Verify that orjson encodes non-finite floats as null."""
+        qobj_dict = {'config': {'shots': 1024, 'rep_delay': float('nan'),
+                                'rep_time': float('inf')}}
+        self.assertEqual(json.loads(dumps_qobj(qobj_dict)),
+                         {'config': {'shots': 1024, 'rep_delay': None, 'rep_time': None}})
+
+
 def _find_potential_encoded(data: Any, c_key: str, tally: set) -> None:
     """Find data that may be in JSON serialized format.
 